@@ -0,0 +1,122 @@
+"""Shared helpers for dataset exploration and splitting."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _count_tokens(buf, offsets, out):
+        for i in prange(len(out)):
+            count = 0
+            in_token = False
+            for j in range(offsets[i], offsets[i + 1]):
+                is_space = buf[j] == 32 or (9 <= buf[j] <= 13)
+                if not is_space and not in_token:
+                    count += 1
+                in_token = not is_space
+            out[i] = count
+
+
+def _sentence_sizes_numba(sentences):
+    """Count tokens with a parallel byte scan over one UTF-8 buffer."""
+    encoded = [s.encode('utf8') for s in sentences]
+
+    buf = np.frombuffer(b" ".join(encoded) + b" ", dtype=np.uint8)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(s) + 1 for s in encoded], out=offsets[1:])
+
+    out = np.empty(len(encoded), dtype=np.int64)
+    _count_tokens(buf, offsets, out)
+    return out
+
+
+def _sentence_sizes(sentences):
+    """Count whitespace-separated tokens per sentence.
+
+    Accepts a Series or any sequence of strings and returns a NumPy
+    array. When numba is available the counting runs as a parallel
+    JIT-compiled scan over a single byte buffer (compiled once and
+    cached on disk); otherwise it falls back to the vectorized
+    str.count kernel.
+    """
+    if njit is not None:
+        return _sentence_sizes_numba(list(sentences))
+    if not isinstance(sentences, pd.Series):
+        sentences = pd.Series(sentences, dtype='string[pyarrow]')
+    return sentences.str.count(r'\S+').to_numpy()
+
+
+def datasplit(data, train_size=0.8, test_size=0.1):
+    """Split a DataFrame into train, test and validation partitions.
+
+    The validation partition receives whatever is left after the
+    train and test fractions are taken.
+    """
+    n = len(data)
+    perm = np.random.permutation(n)
+
+    train_end = int(n * train_size)
+    test_end = train_end + int(n * test_size)
+
+    train = data.iloc[perm[:train_end]]
+    test = data.iloc[perm[train_end:test_end]]
+    val = data.iloc[perm[test_end:]]
+
+    return train, test, val
+
+
+# The histogram shape stabilizes well before this many sentences.
+_N_MAX = 200_000
+
+
+def plot_size_distribution(sentences, bins=100, figsize=(10, 5)):
+    """Plot the histogram of sentence sizes (in tokens).
+
+    Corpora larger than `_N_MAX` are subsampled without replacement
+    and the bin counts rescaled, so the plot keeps the corpus-level
+    counts while the size computation stays bounded.
+    """
+    if len(sentences) > _N_MAX:
+        rng = np.random.default_rng(0)
+        idx = rng.choice(len(sentences), _N_MAX, replace=False)
+        if isinstance(sentences, pd.Series):
+            sample = sentences.iloc[idx]
+        else:
+            sample = [sentences[i] for i in idx]
+        scale = len(sentences) / _N_MAX
+    else:
+        sample = sentences
+        scale = 1.0
+
+    sizes = _sentence_sizes(sample)
+
+    plt.figure(figsize=figsize)
+    plt.hist(sizes, bins=bins, weights=np.full(len(sizes), scale))
+    plt.xlabel('Sentence size')
+    plt.ylabel('Number of sentences')
+    plt.show()
+
+
+def plot_cumulative_size_distribution(sentences, figsize=(10, 5)):
+    """Plot how many sentences have at most each size (in tokens)."""
+    sizes = _sentence_sizes(sentences)
+
+    x_values = np.linspace(0, sizes.max(), 100, dtype=np.int64)
+
+    # One sort plus a binary search per x instead of rescanning every
+    # sentence size for each point on the curve.
+    sorted_sizes = np.sort(sizes)
+    y_values = np.searchsorted(sorted_sizes, x_values, side='right')
+
+    plt.figure(figsize=figsize)
+    plt.plot(x_values, y_values)
+    plt.xlabel('Sentence size')
+    plt.ylabel('Number of sentences')
+    plt.show()
@@ -0,0 +1,121 @@
+"""Recommendation classification over B2W-Reviews01 with BERT.
+
+This script prepares the train/test/validation splits used by the
+fine-tuning notebooks: it downloads the raw corpus, cleans the review
+texts and writes the splits either locally or to the experiment
+bucket on Google Cloud Storage.
+"""
+
+import functools
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import yaml
+from dotenv import load_dotenv
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from src.data import b2w
+from src.experiments import gcp_util
+from src.experiments import util
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(cfg_file):
+    """Parse the YAML configuration, once per file per process."""
+    with open(cfg_file, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def setup(cfg_file):
+    """Load environment variables and the experiment configuration."""
+    load_dotenv()
+    return _load_config(cfg_file)
+
+
+def text_tranformation(data):
+    """Normalize review texts before tokenization.
+
+    Lowercases the text, collapses numbers into a NUM token, isolates
+    punctuation and normalizes whitespace. The rewrites run directly
+    on the Arrow ChunkedArray through pyarrow.compute, so the column
+    never crosses back into per-row Python objects and the re2-based
+    kernels amortize automaton construction over the whole chunk.
+    """
+    arr = pa.array(data['text'], type=pa.string())
+    arr = pc.utf8_lower(arr)
+    arr = pc.replace_substring_regex(
+        arr, pattern=r"\d+(?:[.,]\d+)?", replacement=" NUM ")
+    arr = pc.replace_substring_regex(
+        arr, pattern=r"([?.!,¿])", replacement=r" \1 ")
+    arr = pc.replace_substring_regex(
+        arr, pattern=r"\s+", replacement=" ")
+    arr = pc.utf8_trim_whitespace(arr)
+
+    data['text'] = pd.array(arr, dtype='string[pyarrow]')
+    return data
+
+
+def _write_csv(df, path):
+    """Write a split with PyArrow's CSV writer.
+
+    The writer formats columns in parallel straight from the Arrow
+    buffers instead of going cell by cell through DataFrame.to_csv.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(
+        table, path, write_options=pacsv.WriteOptions(delimiter=';'))
+
+
+def _clean_chunk(chunk):
+    """Drop incomplete rows and clean the texts of one chunk."""
+    return text_tranformation(chunk.dropna())
+
+
+def dataprep(config):
+    """Download, clean and split the corpus for the experiment."""
+    b2w.download_csv(config['DATA_URL'], config['DATA_PATH'])
+
+    dataset = b2w.get_recommendation_data(
+        config['DATA_PATH'],
+        sep=';',
+        chunksize=config.get('CHUNKSIZE'),
+        transform=_clean_chunk)
+
+    # The cleaning pass normalized all whitespace to single spaces,
+    # so the token count is the space count plus one.
+    ntokens = dataset['text'].str.count(' ').add(1)
+    dataset = dataset[ntokens <= config['MAX_SENTENCE_SIZE']]
+
+    train_df, test_df, val_df = util.datasplit(
+        dataset,
+        train_size=config['TRAIN_SIZE'],
+        test_size=config['TEST_SIZE'])
+
+    if config['ENVIRONMENT'] == 'CLOUD':
+        bucket_name = config['BUCKET_NAME']
+        gcp_util.upload_dataframe_csv(
+            train_df, bucket_name, config['TRAIN_FILE'])
+        gcp_util.upload_dataframe_csv(
+            test_df, bucket_name, config['TEST_FILE'])
+        gcp_util.upload_dataframe_csv(
+            val_df, bucket_name, config['VAL_FILE'])
+    else:
+        _write_csv(train_df, config['TRAIN_FILE'])
+        _write_csv(test_df, config['TEST_FILE'])
+        _write_csv(val_df, config['VAL_FILE'])
+
+
+def run(cfg_file):
+    """Run the data preparation stage of the experiment."""
+    config = setup(cfg_file)
+    dataprep(config)
+
+
+if __name__ == '__main__':
+    run('config/cls_b2w_bert.yaml')
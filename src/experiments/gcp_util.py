@@ -0,0 +1,57 @@
+"""Helpers to access Google Cloud Storage from the experiments."""
+
+import functools
+import os
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from google.cloud import storage
+from google.oauth2 import service_account
+
+
+@functools.lru_cache(maxsize=1)
+def get_service_credentials():
+    """Load the service account credentials from the environment.
+
+    The credential file is read once per process and the parsed
+    credentials are reused afterwards.
+    """
+    cred_file = os.environ['GOOGLE_APPLICATION_CREDENTIALS']
+    return service_account.Credentials.from_service_account_file(cred_file)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return the storage client shared by the experiments.
+
+    A single client keeps one authenticated connection pool, so
+    repeated storage calls within a run reuse the same session.
+    """
+    credentials = get_service_credentials()
+    return storage.Client(
+        credentials=credentials,
+        project=credentials.project_id)
+
+
+@functools.lru_cache(maxsize=1)
+def get_bucket(bucket_name):
+    """Return the storage bucket used by the experiments."""
+    return get_client().get_bucket(bucket_name)
+
+
+def upload_dataframe_csv(df, bucket_name, blob_path,
+                         chunk_size=8 << 20, delimiter=';'):
+    """Stream a DataFrame to a bucket blob as CSV.
+
+    The frame is serialized by PyArrow's CSV writer, which formats
+    columns in parallel straight from the Arrow buffers, and the
+    bytes flow into a resumable upload, so memory stays bounded by
+    `chunk_size` instead of buffering the whole serialized object
+    before a single PUT.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    blob = get_bucket(bucket_name).blob(blob_path)
+    blob.chunk_size = chunk_size
+    with blob.open('wb') as f:
+        pacsv.write_csv(
+            table, f, write_options=pacsv.WriteOptions(delimiter=delimiter))
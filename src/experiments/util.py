@@ -0,0 +1,22 @@
+"""Shared helpers for the experiment scripts."""
+
+import numpy as np
+
+
+def datasplit(data, train_size=0.8, test_size=0.1):
+    """Split a DataFrame into train, test and validation partitions.
+
+    The validation partition receives whatever is left after the
+    train and test fractions are taken.
+    """
+    n = len(data)
+    perm = np.random.permutation(n)
+
+    train_end = int(n * train_size)
+    test_end = train_end + int(n * test_size)
+
+    train = data.iloc[perm[:train_end]]
+    test = data.iloc[perm[train_end:test_end]]
+    val = data.iloc[perm[test_end:]]
+
+    return train, test, val